@@ -0,0 +1,339 @@
+"""
+Offline micro-benchmarks for the honeypot hot paths.
+
+    python benchmarks/bench_hotpaths.py                       # run and compare to baseline
+    python benchmarks/bench_hotpaths.py --update-baseline     # record a new baseline
+    python benchmarks/bench_hotpaths.py --output results.json
+    python benchmarks/bench_hotpaths.py --require-baseline    # CI: missing baseline entries fail
+
+The LLM client and the SSH transport are stubbed, so no API key or network is used.
+Each sample repeats the benchmark until it takes at least --min-time seconds; the
+fastest sample is compared with the baseline. Exits with status 1 if any benchmark
+is slower than its baseline by more than the tolerance.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_TOLERANCE = 0.5
+DEFAULT_MIN_TIME = 0.05
+THREADS = 8
+
+BENCHMARKS = []
+
+
+def benchmark(name, ops):
+    """
+    Register a benchmark; the wrapped function performs `ops` operations per call
+    and may return a count of errors (e.g. lost races) it observed.
+    """
+    def wrap(fn):
+        BENCHMARKS.append((name, ops, fn))
+        return fn
+    return wrap
+
+
+def run_threads(worker, count=THREADS):
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+# =============================
+#          Benchmarks
+# =============================
+
+def define_benchmarks():
+    import llm
+    import logger as honeypot_logger
+    import ssh_server
+
+    # Keep per-call log lines out of the measurements; the file loggers must
+    # still write to their files but not to the root (stderr) handler.
+    for name in ("LLM_Honeypot", "SSH_Server"):
+        logging.getLogger(name).setLevel(logging.CRITICAL)
+    honeypot_logger.cmd_logger.propagate = False
+    honeypot_logger.auth_logger.propagate = False
+
+    examples = llm.DEFAULT_FEW_SHOT_EXAMPLES
+    system_prompt = llm.load_system_prompt()
+    for n in (10, 100, 1800):
+        subset = (examples * (n // len(examples) + 1))[:n]
+
+        @benchmark(f"build_few_shot_prompt[{n}]", ops=1)
+        def _prompt(subset=subset):
+            llm.build_few_shot_prompt(system_prompt, subset, "cat /etc/passwd")
+
+    with patch("llm.AsyncOpenAI"):
+        model = llm.LLM(api_key="bench-key")
+    chunk = "```bash\n**drwxr-xr-x** 2 root root 4096 `file_name_1` __init__.py\n```\n"
+    large_output = chunk * (64 * 1024 // len(chunk))
+
+    @benchmark("LLM._sanitize[64KiB]", ops=1)
+    def _sanitize():
+        model._sanitize(large_output)
+
+    cache_ops = 2000
+
+    @benchmark(f"TTLCache.get_set[{THREADS}threads]", ops=THREADS * cache_ops)
+    def _cache():
+        cache = llm.TTLCache(ttl_seconds=300, max_size=200)
+        races = [0] * THREADS
+
+        # TTLCache has no lock: a key evicted by another thread between the
+        # membership test and the lookup in get() raises KeyError. Count those
+        # so the race shows up in the results instead of being hidden.
+        def worker(i):
+            for j in range(cache_ops):
+                key = f"cmd-{(i * 31 + j) % 400}"
+                try:
+                    if cache.get(key) is None:
+                        cache.set(key, "value")
+                except (KeyError, RuntimeError):
+                    races[i] += 1
+        run_threads(worker)
+        return sum(races)
+
+    breaker_ops = 2000
+
+    @benchmark(f"CircuitBreaker[{THREADS}threads]", ops=THREADS * breaker_ops)
+    def _breaker():
+        breaker = llm.CircuitBreaker(fail_threshold=3, reset_time=0)
+
+        def worker(i):
+            for j in range(breaker_ops):
+                if breaker.allow_request():
+                    if (i + j) % 5 == 0:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+        run_threads(worker)
+
+    log_ops = 1000
+    log_output = "total 12\ndrwxr-xr-x 2 root root 4096 .\n" * 20
+
+    @benchmark("logger.log_cmd", ops=log_ops)
+    def _log_cmd():
+        for i in range(log_ops):
+            honeypot_logger.log_cmd(f"ls -la /tmp/{i}", log_output)
+
+    @benchmark("logger.log_auth", ops=log_ops)
+    def _log_auth():
+        for i in range(log_ops):
+            honeypot_logger.log_auth("root", f"hunter{i}")
+
+    session = (b"ls -la /var/www/html\x7f\x7fhtml\r" * 200) + b"exit\r"
+
+    @benchmark("handle_connection.input_loop[bytes]", ops=len(session))
+    def _input_loop():
+        channel = FakeChannel(session)
+        with patch("ssh_server.paramiko.Transport", lambda sock: FakeTransport(channel)), \
+                patch("ssh_server.log_cmd", lambda cmd, output: None):
+            ssh_server.handle_connection(MagicMock(), StubLLM())
+
+
+# =============================
+#            Stubs
+# =============================
+
+class StubLLM:
+    api_model = "stub"
+
+    async def answer(self, query, log_history=None):
+        return "index.html"
+
+    def log_routing_summary(self):
+        pass
+
+
+class FakeChannel:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def recv(self, n):
+        chunk = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return chunk
+
+    def send(self, data):
+        return len(data)
+
+
+class FakeTransport:
+    def __init__(self, channel):
+        self.channel = channel
+
+    def add_server_key(self, key):
+        pass
+
+    def start_server(self, server):
+        server.event.set()
+
+    def accept(self, timeout=None):
+        return self.channel
+
+    def close(self):
+        pass
+
+
+# =============================
+#        Runner / Compare
+# =============================
+
+def measure(fn, ops, repeats, min_time=DEFAULT_MIN_TIME):
+    """Time `fn` in samples of at least `min_time` seconds, like timeit's autorange."""
+    errors = fn() or 0  # warm-up
+    loops = 1
+    while True:
+        elapsed, errs = _run_loops(fn, loops)
+        errors += errs
+        if elapsed >= min_time:
+            break
+        loops *= 2
+
+    samples = [elapsed / (loops * ops)]
+    for _ in range(repeats - 1):
+        elapsed, errs = _run_loops(fn, loops)
+        samples.append(elapsed / (loops * ops))
+        errors += errs
+
+    best = min(samples)
+    return {
+        "ops": ops,
+        "loops": loops,
+        "repeats": repeats,
+        "min_s_per_op": best,
+        "median_s_per_op": statistics.median(samples),
+        "ops_per_sec": 1.0 / best if best else None,
+        "errors": errors,
+    }
+
+
+def _run_loops(fn, loops):
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(loops):
+        errors += fn() or 0
+    return time.perf_counter() - start, errors
+
+
+def compare(results, baseline, tolerance, require_baseline=False):
+    """Annotate `results` with a status per benchmark and return the names that fail."""
+    failures = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            result["status"] = "no-baseline"
+            if require_baseline:
+                failures.append(name)
+            continue
+
+        base_time = base["min_s_per_op"]
+        result["baseline_s_per_op"] = base_time
+        if base_time <= 0:
+            result["status"] = "invalid-baseline"
+            failures.append(name)
+            continue
+
+        result["ratio"] = result["min_s_per_op"] / base_time
+        if result["ratio"] > 1 + base.get("tolerance", tolerance):
+            result["status"] = "regressed"
+            failures.append(name)
+        else:
+            result["status"] = "ok"
+    return failures
+
+
+def update_baseline(baseline, results):
+    """Record new timings, keeping any per-entry tolerance already in the baseline."""
+    for name, result in results.items():
+        entry = {"min_s_per_op": result["min_s_per_op"]}
+        if "tolerance" in baseline.get(name, {}):
+            entry["tolerance"] = baseline[name]["tolerance"]
+        baseline[name] = entry
+    return baseline
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--output", help="write JSON results to this file (default: stdout)")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="minimum duration of one sample in seconds")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown vs baseline, e.g. 0.25 = 25%%")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--require-baseline", action="store_true",
+                        help="fail benchmarks that have no baseline entry")
+    args = parser.parse_args(argv)
+
+    # Log files and the SSH host key are created relative to cwd; keep them out of the repo
+    workdir = tempfile.mkdtemp(prefix="honeypot-bench-")
+    shutil.copy(os.path.join(PROJECT_ROOT, "test_rsa.key"), workdir)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        define_benchmarks()
+        results = {}
+        for name, ops, fn in BENCHMARKS:
+            if args.filter in name:
+                results[name] = measure(fn, ops, args.repeats, args.min_time)
+                errors = results[name]["errors"]
+                note = f"  ({errors} errors)" if errors else ""
+                print(f"{name:45s} {results[name]['min_s_per_op'] * 1e6:12.3f} us/op{note}", file=sys.stderr)
+    finally:
+        os.chdir(cwd)
+        logging.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        update_baseline(baseline, results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        failures = []
+    else:
+        failures = compare(results, baseline, args.tolerance, args.require_baseline)
+
+    report = json.dumps({"results": results, "failures": failures}, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+    else:
+        print(report)
+
+    for name in failures:
+        r = results[name]
+        if r["status"] == "regressed":
+            print(f"REGRESSION: {name} is {r['ratio']:.2f}x baseline", file=sys.stderr)
+        else:
+            print(f"FAILED: {name} ({r['status']}); run with --update-baseline", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
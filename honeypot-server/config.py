@@ -2,6 +2,8 @@ from dotenv import load_dotenv
 from pydantic import BaseModel, Field, ValidationError
 import os
 
+from router import COMPLEX, STANDARD, TRIVIAL
+
 # Load .env variables
 load_dotenv()
 
@@ -12,15 +14,41 @@ class Config(BaseModel):
     CIRCUIT_FAIL_THRESHOLD: int = Field(default=3)
     CIRCUIT_RESET_TIME: int = Field(default=30)
 
+    # Command routing: empty model name means "use MODEL_NAME"
+    FAST_MODEL: str = Field(default="")
+    STANDARD_MODEL: str = Field(default="")
+    STRONG_MODEL: str = Field(default="")
+    # e.g. "none"/"low" for thinking models, whose reasoning counts against max_tokens
+    REASONING_EFFORT: str = Field(default="")
+    TRIVIAL_MAX_TOKENS: int = Field(default=128, gt=0)
+    STANDARD_MAX_TOKENS: int = Field(default=512, gt=0)
+    COMPLEX_MAX_TOKENS: int = Field(default=1024, gt=0)
+
+    def routing_table(self):
+        """Map each command class to its model tier and output-token cap."""
+        effort = self.REASONING_EFFORT or None
+        return {
+            TRIVIAL: {"model": self.FAST_MODEL or None, "max_tokens": self.TRIVIAL_MAX_TOKENS, "reasoning_effort": effort},
+            STANDARD: {"model": self.STANDARD_MODEL or None, "max_tokens": self.STANDARD_MAX_TOKENS, "reasoning_effort": effort},
+            COMPLEX: {"model": self.STRONG_MODEL or None, "max_tokens": self.COMPLEX_MAX_TOKENS, "reasoning_effort": effort},
+        }
+
 
 def load_config():
     """Load and validate configuration values."""
     try:
         cfg = Config(
-            API_KEY=os.getenv("API_KEY"),
+            API_KEY=os.getenv("GEMINI_API_KEY") or os.getenv("API_KEY"),
             TIMEOUT=int(os.getenv("TIMEOUT", 10)),
             CIRCUIT_FAIL_THRESHOLD=int(os.getenv("CIRCUIT_FAIL_THRESHOLD", 3)),
             CIRCUIT_RESET_TIME=int(os.getenv("CIRCUIT_RESET_TIME", 30)),
+            FAST_MODEL=os.getenv("FAST_MODEL", ""),
+            STANDARD_MODEL=os.getenv("STANDARD_MODEL", ""),
+            STRONG_MODEL=os.getenv("STRONG_MODEL", ""),
+            REASONING_EFFORT=os.getenv("REASONING_EFFORT", ""),
+            TRIVIAL_MAX_TOKENS=int(os.getenv("TRIVIAL_MAX_TOKENS", 128)),
+            STANDARD_MAX_TOKENS=int(os.getenv("STANDARD_MAX_TOKENS", 512)),
+            COMPLEX_MAX_TOKENS=int(os.getenv("COMPLEX_MAX_TOKENS", 1024)),
         )
         return cfg
     except ValidationError as e:
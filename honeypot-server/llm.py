@@ -7,6 +7,7 @@ import re
 import logging
 from collections import OrderedDict
 from openai import AsyncOpenAI
+from router import CommandRouter
 
 # Configure Logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -114,7 +115,7 @@ def build_few_shot_prompt(system_prompt, examples, user_input):
 # =============================
 
 class LLM:
-    def __init__(self, api_key=None, api_model=None, max_examples=None, max_retries=3):
+    def __init__(self, api_key=None, api_model=None, max_examples=None, max_retries=3, routing_table=None):
         self.api_model = api_model or os.getenv("MODEL_NAME") or "gemini-2.0-flash"
         self.examples = DEFAULT_FEW_SHOT_EXAMPLES[:max_examples] if max_examples else DEFAULT_FEW_SHOT_EXAMPLES
         self.max_retries = max_retries
@@ -134,8 +135,18 @@ class LLM:
         self.circuit = CircuitBreaker(fail_threshold=3, reset_time=20)
         self.cache = TTLCache(ttl_seconds=300, max_size=200)
 
+        # Per-command model tier and output-token cap
+        self.router = CommandRouter(examples=DEFAULT_FEW_SHOT_EXAMPLES, routing_table=routing_table)
+
         logger.info(f"LLM initialized. Model: {self.api_model}")
 
+    def routing_report(self):
+        """Per-tier routing decisions, latency and token spend."""
+        return self.router.stats.snapshot()
+
+    def log_routing_summary(self):
+        self.router.stats.log_summary()
+
     def _sanitize(self, text: str) -> str:
         """
         Removes markdown code blocks, bolding, and keeps output looking like raw terminal text.
@@ -157,34 +168,53 @@ class LLM:
     async def answer(self, query, log_history=None):
         if log_history is None: log_history = []
         
-        # 1. Cache Check
+        # 1. Route to a model tier
+        route = self.router.route(query)
+        model = route.model or self.api_model
+
+        # 2. Cache Check
         cache_key = f"{query}::{len(log_history)}"
         cached_resp = self.cache.get(cache_key)
         if cached_resp:
             logger.info(f"Cache Hit for: {query[:10]}...")
+            self.router.stats.record_decision(route, outcome="cache")
             return cached_resp
 
-        # 2. Circuit Breaker Check
+        # 3. Circuit Breaker Check
         if not self.circuit.allow_request():
             logger.warning("Request blocked by Circuit Breaker.")
+            self.router.stats.record_decision(route, outcome="blocked")
             return "Connection timed out"
 
-        # 3. Construct Payload
+        # 4. Construct Payload
+        self.router.stats.record_decision(route)
+        logger.info(f"Route: {route.command_class} ({route.source}) -> {model}, max_tokens={route.max_tokens}")
+
         prompt_content = build_few_shot_prompt(self.system_prompt, self.examples, query)
         messages = [{"role": "user" if i % 2 == 0 else "assistant", "content": m} for i, m in enumerate(log_history)]
         messages.append({"role": "user", "content": prompt_content})
 
-        # 4. Execute with Retries
+        request = dict(
+            model=model,
+            messages=messages,
+            max_tokens=route.max_tokens,
+            temperature=0.0, # Low temp for consistent terminal output
+        )
+        if route.reasoning_effort:
+            request["reasoning_effort"] = route.reasoning_effort
+
+        # 5. Execute with Retries
         for attempt in range(1, self.max_retries + 1):
             try:
-                completion = await self.client.chat.completions.create(
-                    model=self.api_model,
-                    messages=messages,
-                    max_tokens=1024,
-                    temperature=0.0, # Low temp for consistent terminal output
-                )
+                start = time.perf_counter()
+                try:
+                    completion = await self.client.chat.completions.create(**request)
+                    raw_text = completion.choices[0].message.content
+                except Exception:
+                    self.router.stats.record_attempt(route, time.perf_counter() - start, ok=False)
+                    raise
+                self.router.stats.record_attempt(route, time.perf_counter() - start, getattr(completion, "usage", None))
                 
-                raw_text = completion.choices[0].message.content
                 clean_text = self._sanitize(raw_text)
                 
                 # Success: Update State
@@ -6,6 +6,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from ssh_server import start_ssh_server
 from llm import LLM
+from config import load_config
 
 def load_env():
     """Manually load .env file to ensure API keys are set."""
@@ -38,7 +39,8 @@ def main():
     # 3. Start Server
     try:
         # Initialize LLM (it will read the key from env if not passed, but we pass it to be safe)
-        llm = LLM(api_key=api_key, max_examples=None)
+        cfg = load_config()
+        llm = LLM(api_key=api_key, max_examples=None, routing_table=cfg.routing_table())
         start_ssh_server(llm, port=2222)
     except Exception as e:
         print(f"[-] Critical Error: {e}")
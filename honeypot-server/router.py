@@ -0,0 +1,271 @@
+import math
+import os
+import re
+import threading
+import logging
+from collections import Counter, defaultdict
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger("LLM_Honeypot")
+
+# =============================
+#        Routing Table
+# =============================
+
+TRIVIAL = "trivial"
+STANDARD = "standard"
+COMPLEX = "complex"
+COMMAND_CLASSES = (TRIVIAL, STANDARD, COMPLEX)
+
+# model=None means "use the LLM's own api_model"; switching models per tier is opt-in.
+# reasoning_effort is passed through for thinking models (e.g. gemini-2.5-*),
+# whose thinking tokens count against max_tokens.
+DEFAULT_ROUTING_TABLE = {
+    TRIVIAL: {"model": None, "max_tokens": 128, "reasoning_effort": None},
+    STANDARD: {"model": None, "max_tokens": 512, "reasoning_effort": None},
+    COMPLEX: {"model": None, "max_tokens": 1024, "reasoning_effort": None},
+}
+
+
+class Route(NamedTuple):
+    command_class: str
+    model: Optional[str]
+    max_tokens: int
+    source: str  # "rule" or "classifier"
+    reasoning_effort: Optional[str] = None
+
+
+# =============================
+#         Rule Stage
+# =============================
+
+# Only rules may send a command to the trivial tier; keep this to commands
+# whose real output is a line or two.
+TRIVIAL_COMMANDS = {
+    "pwd", "whoami", "id", "hostname", "date", "uptime", "echo", "cd",
+    "mkdir", "rmdir", "touch", "rm", "cp", "mv", "clear", "true", "false",
+    "which", "whereis", "type", "tty", "logname", "groups", "nproc", "arch",
+    "sleep", "kill", "chmod", "chown", "export", "unset",
+}
+
+LONG_OUTPUT_COMMANDS = {
+    "ps", "top", "htop", "netstat", "ss", "dmesg", "journalctl", "find",
+    "env", "printenv", "lsof", "lsmod", "lspci", "lsusb", "lscpu", "lsblk",
+    "mount", "apt", "apt-get", "yum", "dnf", "pip", "pip3", "npm", "wget",
+    "curl", "history", "nmap", "strace", "tcpdump", "iptables", "dpkg", "rpm",
+    "systemctl", "service", "crontab", "last", "w", "who", "free", "df", "du",
+    "ifconfig", "ip", "locate", "docker", "kubectl", "make", "gcc", "tree",
+}
+
+LONG_OUTPUT_PATHS = re.compile(r"/var/log/|/proc/|/etc/(passwd|shadow|group|services)\b")
+RECURSIVE_FLAG = re.compile(r"\s(-\w*R\w*|--recursive)(\s|$)")
+SHELL_CONSTRUCTS = re.compile(r"\||&&|;|\$\(|`|>|<")
+INTERPRETERS = re.compile(r"^(python3?|perl|ruby|bash|sh|node)$")
+SUDO_OPTIONS_WITH_ARG = {"-u", "-g", "-h", "-p", "-C", "-U", "-D", "-r", "-t"}
+
+
+def base_command(command):
+    parts = command.strip().split()
+    if parts and parts[0] == "sudo":
+        parts = parts[1:]
+        while parts and parts[0].startswith("-"):
+            skip = 2 if parts[0] in SUDO_OPTIONS_WITH_ARG else 1
+            parts = parts[skip:]
+    if not parts:
+        return ""
+    return os.path.basename(parts[0])
+
+
+def classify_by_rules(command):
+    """Return a command class for unambiguous commands, or None to defer to the classifier."""
+    command = command.strip()
+    if not command:
+        return TRIVIAL
+    if SHELL_CONSTRUCTS.search(command):
+        return COMPLEX
+
+    base = base_command(command)
+    if INTERPRETERS.match(base) and " -c " in f" {command} ":
+        return COMPLEX
+    if base in LONG_OUTPUT_COMMANDS or LONG_OUTPUT_PATHS.search(command):
+        return COMPLEX
+    if base == "ls" and RECURSIVE_FLAG.search(command):
+        return COMPLEX
+    if base in TRIVIAL_COMMANDS:
+        return TRIVIAL
+    return None
+
+
+def label_by_family(command):
+    """
+    Training label for a few-shot example. The responses in fewshots.json are
+    not paired with their commands, so labels come from the command family.
+    The classifier never predicts trivial, so rule-trivial examples count as standard.
+    """
+    label = classify_by_rules(command)
+    return COMPLEX if label == COMPLEX else STANDARD
+
+
+# =============================
+#       Classifier Stage
+# =============================
+
+def tokenize_command(command):
+    tokens = [f"cmd:{base_command(command)}"]
+    for part in command.strip().split()[1:]:
+        if part.startswith("-"):
+            tokens.append(f"flag:{part}")
+        elif "/" in part:
+            tokens.extend(f"path:{seg}" for seg in part.split("/") if seg)
+        else:
+            tokens.append(f"arg:{part.lower()}")
+    return tokens
+
+
+class CommandClassifier:
+    """
+    Multinomial naive Bayes over command tokens, trained from few-shot examples.
+    Predicts only standard or complex: a guess never lowers the output-token cap.
+    """
+
+    def __init__(self, alpha=1.0):
+        self.alpha = alpha
+        self.class_counts = Counter()
+        self.token_counts = defaultdict(Counter)
+        self.token_totals = Counter()
+        self.vocab = set()
+
+    def fit(self, examples):
+        for ex in examples:
+            command = ex.get("command") or ""
+            if not command.strip():
+                continue
+            label = label_by_family(command)
+            tokens = tokenize_command(command)
+            self.class_counts[label] += 1
+            self.token_counts[label].update(tokens)
+            self.token_totals[label] += len(tokens)
+            self.vocab.update(tokens)
+        return self
+
+    def predict(self, command):
+        if not self.class_counts:
+            return STANDARD
+
+        total = sum(self.class_counts.values())
+        vocab_size = len(self.vocab) + 1
+        tokens = tokenize_command(command)
+        best_label, best_score = STANDARD, -math.inf
+        for label, count in self.class_counts.items():
+            score = math.log(count / total)
+            denom = self.token_totals[label] + self.alpha * vocab_size
+            counts = self.token_counts[label]
+            for tok in tokens:
+                score += math.log((counts[tok] + self.alpha) / denom)
+            if score > best_score:
+                best_label, best_score = label, score
+        return best_label
+
+
+# =============================
+#         Routing Stats
+# =============================
+
+class RoutingStats:
+    """
+    Thread-safe per-tier counters; the LLM instance is shared across SSH threads.
+    Every routed query is a decision (including cache hits and circuit-breaker
+    blocks); every API call, failed or not, is an attempt with its latency.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.tiers = defaultdict(lambda: {
+            "requests": 0,
+            "rule_decisions": 0,
+            "classifier_decisions": 0,
+            "cache_hits": 0,
+            "blocked": 0,
+            "attempts": 0,
+            "failures": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+        })
+
+    def record_decision(self, route, outcome="api"):
+        """outcome is "api", "cache" or "blocked"."""
+        with self._lock:
+            tier = self.tiers[route.command_class]
+            tier["requests"] += 1
+            tier[f"{route.source}_decisions"] += 1
+            if outcome == "cache":
+                tier["cache_hits"] += 1
+            elif outcome == "blocked":
+                tier["blocked"] += 1
+
+    def record_attempt(self, route, latency, usage=None, ok=True):
+        prompt_tokens = _token_count(usage, "prompt_tokens")
+        completion_tokens = _token_count(usage, "completion_tokens")
+        with self._lock:
+            tier = self.tiers[route.command_class]
+            tier["attempts"] += 1
+            if not ok:
+                tier["failures"] += 1
+            tier["latency_total"] += latency
+            tier["latency_max"] = max(tier["latency_max"], latency)
+            tier["prompt_tokens"] += prompt_tokens
+            tier["completion_tokens"] += completion_tokens
+
+    def snapshot(self):
+        with self._lock:
+            report = {}
+            for name, tier in self.tiers.items():
+                entry = dict(tier)
+                entry["latency_avg"] = tier["latency_total"] / tier["attempts"] if tier["attempts"] else 0.0
+                report[name] = entry
+            return report
+
+    def log_summary(self):
+        for name, tier in sorted(self.snapshot().items()):
+            logger.info(
+                f"Tier {name}: {tier['requests']} req ({tier['rule_decisions']} rule, "
+                f"{tier['classifier_decisions']} classifier, {tier['cache_hits']} cached, "
+                f"{tier['blocked']} blocked), {tier['attempts']} API calls "
+                f"({tier['failures']} failed), avg {tier['latency_avg']:.3f}s, "
+                f"max {tier['latency_max']:.3f}s, tokens in/out "
+                f"{tier['prompt_tokens']}/{tier['completion_tokens']}"
+            )
+
+
+def _token_count(usage, name):
+    value = getattr(usage, name, 0) if usage is not None else 0
+    return value if isinstance(value, int) else 0
+
+
+# =============================
+#           Router
+# =============================
+
+class CommandRouter:
+    def __init__(self, examples=None, routing_table=None):
+        self.table = {cls: dict(tier) for cls, tier in DEFAULT_ROUTING_TABLE.items()}
+        for cls, tier in (routing_table or {}).items():
+            if cls not in self.table:
+                raise ValueError(f"Unknown command class in routing table: {cls}")
+            self.table[cls].update(tier)
+
+        self.classifier = CommandClassifier().fit(examples or [])
+        self.stats = RoutingStats()
+
+    def classify(self, command):
+        label = classify_by_rules(command)
+        if label is not None:
+            return label, "rule"
+        return self.classifier.predict(command), "classifier"
+
+    def route(self, command):
+        command_class, source = self.classify(command)
+        tier = self.table[command_class]
+        return Route(command_class, tier["model"], tier["max_tokens"], source, tier["reasoning_effort"])
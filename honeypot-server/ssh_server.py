@@ -170,6 +170,7 @@ def handle_connection(client_sock, llm_instance):
         # ==========================================
         if loop:
             loop.close()  # Prevents memory leaks
+        llm_instance.log_routing_summary()
         if transport:
             transport.close()
         client_sock.close()
@@ -1,7 +1,9 @@
 import pytest
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 from llm import LLM, CircuitBreaker
+from router import TRIVIAL, CommandRouter
 
 # Mock the OpenAI client to avoid real API costs during tests
 @pytest.fixture
@@ -59,4 +61,73 @@ async def test_caching(mock_llm):
     
     # Second call should hit cache (API count stays 1)
     await mock_llm.answer("ls -la")
-    assert mock_llm.client.chat.completions.create.call_count == 1
\ No newline at end of file
+    assert mock_llm.client.chat.completions.create.call_count == 1
+
+@pytest.mark.asyncio
+async def test_routing_passes_tier_model_and_cap(mock_llm):
+    mock_llm.router = CommandRouter(routing_table={
+        TRIVIAL: {"model": "tiny-model", "max_tokens": 16, "reasoning_effort": "none"},
+    })
+    mock_response = AsyncMock()
+    mock_response.choices[0].message.content = "/root"
+    mock_response.usage = SimpleNamespace(prompt_tokens=40, completion_tokens=2)
+    mock_llm.client.chat.completions.create.return_value = mock_response
+
+    await mock_llm.answer("pwd")
+
+    _, kwargs = mock_llm.client.chat.completions.create.call_args
+    assert kwargs["model"] == "tiny-model"
+    assert kwargs["max_tokens"] == 16
+    assert kwargs["reasoning_effort"] == "none"
+
+    tier = mock_llm.routing_report()[TRIVIAL]
+    assert tier["requests"] == 1
+    assert tier["attempts"] == 1
+    assert tier["prompt_tokens"] == 40
+    assert tier["completion_tokens"] == 2
+
+@pytest.mark.asyncio
+async def test_default_routing_keeps_api_model(mock_llm):
+    mock_response = AsyncMock()
+    mock_response.choices[0].message.content = "total 0"
+    mock_llm.client.chat.completions.create.return_value = mock_response
+
+    await mock_llm.answer("ls -la")
+
+    _, kwargs = mock_llm.client.chat.completions.create.call_args
+    assert kwargs["model"] == mock_llm.api_model
+    assert kwargs["max_tokens"] > 128
+    assert "reasoning_effort" not in kwargs
+
+@pytest.mark.asyncio
+async def test_routing_stats_count_failures_and_cache_hits(mock_llm):
+    mock_llm.max_retries = 1
+    mock_llm.client.chat.completions.create.side_effect = Exception("API Down")
+    await mock_llm.answer("pwd")
+
+    mock_response = AsyncMock()
+    mock_response.choices[0].message.content = "root"
+    mock_llm.client.chat.completions.create.side_effect = None
+    mock_llm.client.chat.completions.create.return_value = mock_response
+    await mock_llm.answer("whoami")
+    await mock_llm.answer("whoami")
+
+    tier = mock_llm.routing_report()[TRIVIAL]
+    assert tier["requests"] == 3
+    assert tier["cache_hits"] == 1
+    assert tier["attempts"] == 2
+    assert tier["failures"] == 1
+
+@pytest.mark.asyncio
+async def test_routing_stats_count_empty_response_as_failure(mock_llm):
+    mock_llm.max_retries = 1
+    mock_response = AsyncMock()
+    mock_response.choices = []
+    mock_llm.client.chat.completions.create.return_value = mock_response
+
+    response = await mock_llm.answer("pwd")
+
+    assert response == "Internal Server Error"
+    tier = mock_llm.routing_report()[TRIVIAL]
+    assert tier["attempts"] == 1
+    assert tier["failures"] == 1
@@ -0,0 +1,74 @@
+import os
+import sys
+import unittest
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+BENCH_DIR = os.path.join(PROJECT_ROOT, "benchmarks")
+if BENCH_DIR not in sys.path:
+    sys.path.append(BENCH_DIR)
+
+from bench_hotpaths import compare, measure, update_baseline
+
+
+def result(seconds):
+    return {"min_s_per_op": seconds}
+
+
+class TestBaselineCompare(unittest.TestCase):
+    def test_statuses(self):
+        results = {"fast": result(1.0), "slow": result(2.0), "new": result(1.0)}
+        baseline = {"fast": {"min_s_per_op": 1.0}, "slow": {"min_s_per_op": 1.0}}
+
+        failures = compare(results, baseline, tolerance=0.5)
+
+        self.assertEqual(failures, ["slow"])
+        self.assertEqual(results["fast"]["status"], "ok")
+        self.assertEqual(results["slow"]["status"], "regressed")
+        self.assertAlmostEqual(results["slow"]["ratio"], 2.0)
+        self.assertEqual(results["new"]["status"], "no-baseline")
+
+    def test_require_baseline_fails_missing_entries(self):
+        results = {"new": result(1.0)}
+        self.assertEqual(compare(results, {}, tolerance=0.5, require_baseline=True), ["new"])
+        self.assertEqual(results["new"]["status"], "no-baseline")
+
+    def test_per_entry_tolerance_overrides_default(self):
+        results = {"tight": result(1.2), "loose": result(2.5)}
+        baseline = {
+            "tight": {"min_s_per_op": 1.0, "tolerance": 0.1},
+            "loose": {"min_s_per_op": 1.0, "tolerance": 2.0},
+        }
+        self.assertEqual(compare(results, baseline, tolerance=0.5), ["tight"])
+        self.assertEqual(results["loose"]["status"], "ok")
+
+    def test_zero_baseline_is_reported_not_raised(self):
+        results = {"broken": result(1.0)}
+        failures = compare(results, {"broken": {"min_s_per_op": 0.0}}, tolerance=0.5)
+        self.assertEqual(failures, ["broken"])
+        self.assertEqual(results["broken"]["status"], "invalid-baseline")
+
+    def test_update_baseline_keeps_tolerance(self):
+        baseline = {"a": {"min_s_per_op": 1.0, "tolerance": 0.8}, "b": {"min_s_per_op": 1.0}}
+        update_baseline(baseline, {"a": result(3.0), "b": result(4.0), "c": result(5.0)})
+        self.assertEqual(baseline["a"], {"min_s_per_op": 3.0, "tolerance": 0.8})
+        self.assertEqual(baseline["b"], {"min_s_per_op": 4.0})
+        self.assertEqual(baseline["c"], {"min_s_per_op": 5.0})
+
+
+class TestMeasure(unittest.TestCase):
+    def test_autorange_and_error_count(self):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            return 1
+
+        stats = measure(fn, ops=1, repeats=3, min_time=0.001)
+        self.assertGreater(stats["loops"], 1)
+        self.assertEqual(stats["errors"], len(calls))
+        self.assertLessEqual(stats["min_s_per_op"], stats["median_s_per_op"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from router import (
+    COMPLEX, STANDARD, TRIVIAL, CommandClassifier, CommandRouter, base_command, classify_by_rules,
+)
+
+
+class TestCommandRouter(unittest.TestCase):
+    def test_rules_classify_obvious_commands(self):
+        self.assertEqual(classify_by_rules("pwd"), TRIVIAL)
+        self.assertEqual(classify_by_rules("sudo whoami"), TRIVIAL)
+        self.assertEqual(classify_by_rules("cat /var/log/syslog"), COMPLEX)
+        self.assertEqual(classify_by_rules("ps aux | grep ssh"), COMPLEX)
+        self.assertEqual(classify_by_rules("python3 -c 'print(1)'"), COMPLEX)
+        self.assertEqual(classify_by_rules("ls -R /"), COMPLEX)
+        self.assertEqual(classify_by_rules("sudo -u root ps aux"), COMPLEX)
+        self.assertIsNone(classify_by_rules("grep root notes.txt"))
+        self.assertIsNone(classify_by_rules("cat if.txt"))
+
+    def test_base_command_skips_sudo_options(self):
+        self.assertEqual(base_command("sudo -u root ps aux"), "ps")
+        self.assertEqual(base_command("sudo -i whoami"), "whoami")
+        self.assertEqual(base_command("/usr/bin/top -b"), "top")
+
+    def test_classifier_learns_from_examples(self):
+        examples = [
+            {"command": "foo --short a", "response": "ok"},
+            {"command": "foo --short b", "response": "ok"},
+            {"command": "bar --dump /var/log/a", "response": "ok"},
+            {"command": "bar --dump /var/log/b", "response": "ok"},
+        ]
+        clf = CommandClassifier().fit(examples)
+        self.assertEqual(clf.predict("foo --short z"), STANDARD)
+        self.assertEqual(clf.predict("bar --dump z"), COMPLEX)
+
+    def test_classifier_never_predicts_trivial(self):
+        clf = CommandClassifier().fit([{"command": "pwd", "response": "/root"}] * 5)
+        self.assertEqual(clf.predict("pwd -P"), STANDARD)
+
+    def test_route_uses_table_and_falls_back_to_classifier(self):
+        router = CommandRouter(
+            examples=[{"command": "grep a b", "response": "m" * 100}],
+            routing_table={TRIVIAL: {"model": "tiny", "max_tokens": 16}},
+        )
+        route = router.route("pwd")
+        self.assertEqual((route.model, route.max_tokens, route.source), ("tiny", 16, "rule"))
+
+        route = router.route("grep x y")
+        self.assertEqual((route.command_class, route.source), (STANDARD, "classifier"))
+        self.assertIsNone(route.model)
+
+    def test_unknown_class_in_table_rejected(self):
+        with self.assertRaises(ValueError):
+            CommandRouter(routing_table={"huge": {"max_tokens": 1}})
+
+    def test_stats_report_per_tier(self):
+        router = CommandRouter()
+        route = router.route("pwd")
+        router.stats.record_decision(route)
+        router.stats.record_attempt(route, 0.2, ok=False)
+        router.stats.record_attempt(route, 0.4, SimpleNamespace(prompt_tokens=50, completion_tokens=3))
+        router.stats.record_decision(route, outcome="cache")
+        router.stats.record_decision(route, outcome="blocked")
+
+        tier = router.stats.snapshot()[TRIVIAL]
+        self.assertEqual(tier["requests"], 3)
+        self.assertEqual(tier["rule_decisions"], 3)
+        self.assertEqual(tier["cache_hits"], 1)
+        self.assertEqual(tier["blocked"], 1)
+        self.assertEqual(tier["attempts"], 2)
+        self.assertEqual(tier["failures"], 1)
+        self.assertEqual(tier["prompt_tokens"], 50)
+        self.assertEqual(tier["completion_tokens"], 3)
+        self.assertAlmostEqual(tier["latency_avg"], 0.3)
+        self.assertAlmostEqual(tier["latency_max"], 0.4)
+
+    def test_default_fewshots_do_not_truncate_listings(self):
+        import json
+        with open(os.path.join(PROJECT_ROOT, "fewshots.json"), encoding="utf-8") as f:
+            router = CommandRouter(examples=json.load(f))
+        for command in ("ls -la", "ls -R /", "ls /", "uname -a", "lscpu", "mount"):
+            route = router.route(command)
+            self.assertNotEqual(route.command_class, TRIVIAL, command)
+            self.assertGreater(route.max_tokens, 128, command)
+        self.assertEqual(router.route("ls -R /").command_class, COMPLEX)
+
+
+if __name__ == "__main__":
+    unittest.main()